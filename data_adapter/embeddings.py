@@ -0,0 +1,52 @@
+import os
+import hashlib
+import threading
+from collections import OrderedDict
+from dotenv import load_dotenv
+import numpy as np
+from huggingface_hub import InferenceClient
+
+load_dotenv()
+
+# Single definition of the stored vector format; zilliz_api.db_dump.create_collection
+# declares INT8_VECTOR fields of this dimension, and every insert goes through embed()
+EMBEDDING_MODEL = "Qwen/Qwen3-Embedding-8B"
+EMBEDDING_DIM   = 4096
+
+# Created once per process and reused by every embedding request
+_hf_client = InferenceClient(provider="auto", api_key=os.environ.get("HF_TOKEN"))
+
+# Embeddings of recently seen titles and bodies, keyed by SHA-256 of the text, so
+# re-scraped posts and repeated titles skip the HF round-trip. Vectors are kept in
+# their stored int8 form (4 KB each at 4096-d) to bound memory.
+EMBEDDING_CACHE_SIZE = 10_000
+_embedding_cache: "OrderedDict[bytes, np.ndarray]" = OrderedDict()
+_embedding_cache_lock = threading.Lock()
+
+def quantize(vectors):
+    """L2-normalize float embeddings row-wise and scale them to int8, preserving cosine similarity."""
+    vectors = np.asarray(vectors, dtype=np.float32)
+    vectors /= np.maximum(np.linalg.norm(vectors, axis=1, keepdims=True), 1e-12)
+    return np.clip(np.round(vectors * 127), -128, 127).astype(np.int8)
+
+def embed(texts):
+    """Return int8 embeddings for `texts`, sending only uncached, distinct texts in a single request."""
+    keys = [hashlib.sha256(text.encode("utf-8")).digest() for text in texts]
+    with _embedding_cache_lock:
+        vectors = {}
+        for key in keys:
+            if key in _embedding_cache:
+                _embedding_cache.move_to_end(key)
+                vectors[key] = _embedding_cache[key]
+    missing = {key: text for key, text in zip(keys, texts) if key not in vectors}
+
+    if missing:
+        embedded = quantize(_hf_client.feature_extraction(list(missing.values()), model=EMBEDDING_MODEL))
+        fresh = dict(zip(missing, embedded))
+        vectors.update(fresh)
+        with _embedding_cache_lock:
+            _embedding_cache.update(fresh)
+            while len(_embedding_cache) > EMBEDDING_CACHE_SIZE:
+                _embedding_cache.popitem(last=False)
+
+    return [vectors[key] for key in keys]
@@ -1,45 +1,125 @@
 import os
+import atexit
+import threading
+from functools import lru_cache
+import json
 from dotenv import load_dotenv
-from huggingface_hub import InferenceClient
 from pymilvus import MilvusClient, connections, Collection
 from datetime import datetime
 
+from embeddings import embed
+
+load_dotenv()
+
+# Created once per process and reused by every insert
+_milvus_client = MilvusClient(uri=os.environ.get("ZILLIZ_URI"), token=os.environ.get("ZILLIZ_TOKEN"))
+atexit.register(_milvus_client.close)
+
 def dump_to_milvus(blog_title, blog_content, URL, company_name):
-    load_dotenv()
+    dump_to_milvus_batch([(blog_title, URL, company_name, blog_content)])
+
+def dump_to_milvus_batch(records):
+    """Insert (title, URL, company_name, content) records with a single insert and flush."""
+    if not records:
+        return
 
     # ============== QWEN EMBEDDINGS ==============
 
-    hf_client = InferenceClient(
-            provider="auto",
-            api_key=os.environ.get("HF_TOKEN"),
-        )
-    blog_title_embeddings   = hf_client.feature_extraction(blog_title,model="Qwen/Qwen3-Embedding-8B",).tolist()[0]
-    blog_content_embeddings = hf_client.feature_extraction(blog_content,model="Qwen/Qwen3-Embedding-8B",).tolist()[0]
+    # One request for every title and body in the batch that isn't cached yet
+    texts      = [record[0] for record in records] + [record[3] for record in records]
+    embeddings = embed(texts)
+    blog_title_embeddings, blog_content_embeddings = embeddings[:len(records)], embeddings[len(records):]
+
+    # Epoch microseconds (INT64 field, see zilliz_api.db_dump.create_collection)
+    timestamp = int(datetime.now().timestamp() * 1_000_000)
+    rows = [{"title":blog_title,
+             "title_embeddings":title_embeddings, 
+             "body":blog_content,
+             "URL":URL,
+             "body_embeddings":content_embeddings,
+             "timestamp":timestamp,
+             "company_name":company_name
+             }
+            for (blog_title, URL, company_name, blog_content), title_embeddings, content_embeddings
+            in zip(records, blog_title_embeddings, blog_content_embeddings)]
 
     # ============== ZILLIZ PIPELINE ==============
 
-    milvus_client = MilvusClient(uri=os.environ.get("ZILLIZ_URI"), token=os.environ.get("ZILLIZ_TOKEN"))
+    collection_name = os.environ.get("COLLECTION_NAME")
 
-    milvus_client.insert(os.environ.get("COLLECTION_NAME"), [{"title":blog_title,
-                                            "title_embeddings":blog_title_embeddings, 
-                                            "body":blog_content,
-                                            "URL":URL,
-                                            "body_embeddings":blog_content_embeddings,
-                                            "timestamp":str(datetime.now()),
-                                            "company_name":company_name
-                                            }])
+    _milvus_client.insert(collection_name, rows)
+    _milvus_client.flush(collection_name)
 
-    print(f"Dumped blog data for \033[1m{blog_title}\033[0m into Milvus successfully! ✅")
+    print(f"Dumped {len(rows)} blogs for \033[1m{records[0][2]}\033[0m into Milvus successfully! ✅")
 
-def search_url_milvus(url):
+# Records buffered by an Ingestor before they are embedded and inserted together
+INSERT_BATCH_SIZE = 128
+
+class Ingestor:
+    """Buffers (title, URL, company_name, content) records across a scrape session and
+    writes them with dump_to_milvus_batch once `threshold` have accumulated."""
+
+    def __init__(self, threshold=INSERT_BATCH_SIZE):
+        self.buf       = []
+        self.threshold = threshold
+        self._lock     = threading.Lock()
+        # Whatever is still buffered when the process exits gets written too
+        atexit.register(self.flush)
+
+    def add(self, record):
+        """Buffer one record; returns the records written to Milvus by this call (usually none)."""
+        with self._lock:
+            self.buf.append(record)
+            if len(self.buf) < self.threshold:
+                return []
+            records, self.buf = self.buf, []
+        return self._write(records)
+
+    def flush(self):
+        """Write every buffered record; returns the records written."""
+        with self._lock:
+            records, self.buf = self.buf, []
+        return self._write(records)
+
+    @staticmethod
+    def _write(records):
+        """Insert records as one batch, falling back to one insert per record if the batch
+        fails (e.g. an oversized body or an HF timeout), so one bad row doesn't sink the rest.
+        Returns only the records that were actually stored."""
+        if not records:
+            return []
+        try:
+            dump_to_milvus_batch(records)
+            return records
+        except Exception as e:
+            print(f"Batch insert of {len(records)} blogs failed, retrying one by one: {e}")
+
+        written = []
+        for record in records:
+            try:
+                dump_to_milvus_batch([record])
+                written.append(record)
+            except Exception as e:
+                print(f"Error dumping blog {record[0]} - {record[1]} into Milvus: {e}")
+        return written
+
+@lru_cache(maxsize=1)
+def _get_collection():
+    # Connected once per process instead of on every lookup, and closed at exit
     connections.connect(
     alias="default",
     uri=os.environ.get("ZILLIZ_URI"),
     token=os.environ.get("ZILLIZ_TOKEN"))
-    collection = Collection(os.environ.get("COLLECTION_NAME"))
-    results = collection.query(expr=f"URL == '{url}'")
+    atexit.register(connections.disconnect, "default")
+    return Collection(os.environ.get("COLLECTION_NAME"))
+
+def search_urls_milvus(urls):
+    """Return the subset of `urls` already stored in Milvus, using a single query."""
+    if not urls:
+        return []
+    results = _get_collection().query(expr=f"URL in {json.dumps(list(urls))}", output_fields=["URL"])
 
-    if len(list(results)) > 0:
-        return True
-    else:
-        return False
\ No newline at end of file
+    return [row["URL"] for row in results]
+
+def search_url_milvus(url):
+    return len(search_urls_milvus([url])) > 0
@@ -1,20 +1,17 @@
+import configparser
+import os
 from datetime import datetime, timedelta
 import pendulum
 from airflow import DAG
-from airflow.operators.python import PythonOperator
+from airflow.decorators import task
 
+CONFIG_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "companies.config")
 
-def run_scraper():
-    from scrap_and_dump import scrape
-    import configparser
 
+def load_companies():
     config = configparser.ConfigParser()
-    config.read("companies.config")
-    companies = config["companies"]
-
-    for company, url in companies.items():
-        print(f"Scraping {company} → {url}")
-        scrape(url, company)
+    config.read(CONFIG_PATH)
+    return config["companies"]
 
 
 local_tz = pendulum.timezone("Europe/Berlin")
@@ -36,8 +33,15 @@ with DAG(
     tags=["scraping", "companies"],
 ) as dag:
 
-    scrape_task = PythonOperator(
-        task_id="run_scraper_task",
-        python_callable=run_scraper,
-    )
-    scrape_task
\ No newline at end of file
+    # The pool caps how many company tasks run at once; each task drives its own
+    # scrap_and_dump.MAX_CONCURRENT_BLOGS headless browsers, so browsers = pool size x that
+    @task(pool="browser_pool")
+    def scrape_one(item):
+        from scrap_and_dump import scrape
+
+        company, url = item
+        print(f"Scraping {company} → {url}")
+        scrape(url, company)
+
+    # One mapped task per company, so a failing company is retried on its own
+    scrape_one.expand(item=list(load_companies().items()))
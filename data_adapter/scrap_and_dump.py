@@ -1,5 +1,6 @@
 import asyncio
-import json
+
+import orjson
 
 from dotenv import load_dotenv
 from browser_use import Agent, ChatGoogle, Browser
@@ -7,19 +8,30 @@ from pathlib import Path
 
 from get_titles import TitleSchema, Title_Extraction_Prompt
 from get_blog import BlogSchema, Blog_Extraction_Prompt
-from milvus_connectors import dump_to_milvus, search_url_milvus
+from milvus_connectors import Ingestor, search_urls_milvus
+from url_filter import load_url_filter, save_url_filter
+
+load_dotenv()
+
+MAX_CONCURRENT_BLOGS = 4
+
+# Shared by every Agent run in this process. The browsers are kept alive between runs
+# so each blog reuses a warm Chromium instead of cold-starting one per URL.
+_LLM      = ChatGoogle(model='gemini-2.0-flash')
+_BROWSERS = [Browser(headless=True, keep_alive=True) for _ in range(MAX_CONCURRENT_BLOGS)]
+
+# Scraped blogs are buffered here and written to Milvus in large batches
+_INGESTOR = Ingestor()
 
-async def run_browser_agent(url: str, stage: str):
-    load_dotenv()
-    llm     = ChatGoogle(model='gemini-2.0-flash')
-    browser = Browser(headless=False)
+async def run_browser_agent(url: str, stage: str, browser: Browser = None):
+    browser = browser or _BROWSERS[0]
 
     if stage == "titles":
         task  = Title_Extraction_Prompt(url)
         agent = Agent(
             task=task.prompt,
             browser=browser,
-            llm=llm,
+            llm=_LLM,
             output_model_schema=TitleSchema
     )
     
@@ -28,17 +40,33 @@ async def run_browser_agent(url: str, stage: str):
         agent = Agent(
             task=task.prompt,
             browser=browser,
-            llm=llm,
+            llm=_LLM,
             output_model_schema=BlogSchema
         )
 
     history = await agent.run(max_steps=100)
     return history.final_result()
 
+def parse_result(result: str):
+    # The agent hands back the whole document as a string, so a single orjson pass is the cheapest parse
+    return orjson.loads(result).get("Result", [])
+
+async def close_browsers():
+    await asyncio.gather(*(browser.kill() for browser in _BROWSERS), return_exceptions=True)
+
+async def scrape_async(url : str, company_name : str):
+    try:
+        await _scrape_company(url, company_name)
+    finally:
+        await close_browsers()
+
 def scrape(url : str, company_name : str):
-    result = asyncio.run(run_browser_agent(url = url, stage = "titles")) 
-    scrapped_json = json.loads(result)
-    scrapped_json = scrapped_json.get("Result", []) 
+    # One event loop for the whole company, so every blog runs on the same loop
+    asyncio.run(scrape_async(url, company_name))
+
+async def _scrape_company(url : str, company_name : str):
+    result = await run_browser_agent(url = url, stage = "titles")
+    scrapped_json = parse_result(result)
 
     # # create a folder 
     # Path(company_name).mkdir(exist_ok=True)
@@ -50,24 +78,61 @@ def scrape(url : str, company_name : str):
 
     print(f"Total of {len(scrapped_json)} blogs found for {company_name}.")
 
-    # Scrape each blog
-    for blog in scrapped_json:
+    # Scrape blogs concurrently; each worker borrows a browser from the pool, which
+    # also bounds how many run at once
+    pool = asyncio.Queue()
+    for browser in _BROWSERS:
+        pool.put_nowait(browser)
+
+    async def worker(blog):
         blog_title = blog["Title"]
         blog_url  =  blog["URL"]
-        if search_url_milvus(blog_url):
-            print(f"Blog already exists in Milvus: {blog_title} - {blog_url}")
-            continue
-        else:
-            try:
-                result = asyncio.run(run_browser_agent(url = blog_url, stage = "blog")) 
-                scrapped_blog = json.loads(result)
-                scrapped_blog = scrapped_blog.get("Result", []) 
-                dump_to_milvus(blog_title, scrapped_blog, blog_url, company_name)
-            except Exception as e:
-                print(f"Error scraping blog {blog_title} - {blog_url}: {e}")
-                continue
+        browser = await pool.get()
+        try:
+            result = await run_browser_agent(url = blog_url, stage = "blog", browser = browser)
+            scrapped_blog = parse_result(result)
+        except Exception as e:
+            print(f"Error scraping blog {blog_title} - {blog_url}: {e}")
+            return None
+        finally:
+            pool.put_nowait(browser)
 
         # Save scrapped blogs 
         # out_path = Path(f"{company_name}/{blog_title}.json")
         # with out_path.open("w", encoding="utf-8") as f:
-        #     json.dump(scrapped_blog, f, ensure_ascii=False, indent=2)
\ No newline at end of file
+        #     json.dump(scrapped_blog, f, ensure_ascii=False, indent=2)
+
+        return (blog_title, blog_url, company_name, scrapped_blog)
+
+    # URLs in the Bloom filter were ingested by an earlier run; the rest are checked
+    # with one Milvus round-trip for the whole list instead of one per blog
+    seen       = load_url_filter()
+    candidates = [blog for blog in scrapped_json if blog["URL"] not in seen]
+    existing   = set(search_urls_milvus([blog["URL"] for blog in candidates]))
+    for blog_url in existing:
+        seen.add(blog_url)
+    to_scrape  = [blog for blog in candidates if blog["URL"] not in existing]
+    print(f"{len(scrapped_json) - len(to_scrape)} blogs already exist in Milvus for {company_name}.")
+
+    def mark_seen(records):
+        for record in records:
+            seen.add(record[1])
+
+    # Hand finished blogs to the ingestor while the remaining ones are still being scraped;
+    # it runs in a thread so a batch insert doesn't stall the browsers on the event loop.
+    # Whatever happens, the URLs stored so far are persisted in the Bloom filter
+    try:
+        for next_blog in asyncio.as_completed([worker(blog) for blog in to_scrape]):
+            try:
+                record = await next_blog
+                if record is not None:
+                    mark_seen(await asyncio.to_thread(_INGESTOR.add, record))
+            except Exception as e:
+                print(f"Error scraping blog for {company_name}: {e}")
+
+        try:
+            mark_seen(await asyncio.to_thread(_INGESTOR.flush))
+        except Exception as e:
+            print(f"Error dumping remaining blogs for {company_name}: {e}")
+    finally:
+        save_url_filter(seen)
@@ -0,0 +1,22 @@
+import os
+import tempfile
+from pybloom_live import ScalableBloomFilter
+
+# Bloom filter of blog URLs already ingested into Milvus, persisted between runs so
+# returning URLs are skipped without a Milvus lookup
+BLOOM_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "blogs.bloom")
+
+def load_url_filter():
+    if os.path.exists(BLOOM_PATH):
+        with open(BLOOM_PATH, "rb") as f:
+            return ScalableBloomFilter.fromfile(f)
+    return ScalableBloomFilter(initial_capacity=1_000_000, error_rate=1e-4)
+
+def save_url_filter(seen):
+    # Write to a temp file and swap it in, so a concurrent company task never reads a
+    # half-written filter. If two tasks race, the last one wins; the URLs it misses are
+    # simply looked up in Milvus again next time.
+    fd, tmp_path = tempfile.mkstemp(dir=os.path.dirname(BLOOM_PATH), suffix=".tmp")
+    with os.fdopen(fd, "wb") as f:
+        seen.tofile(f)
+    os.replace(tmp_path, BLOOM_PATH)
@@ -1,34 +1,37 @@
 import os
+import csv
+import hashlib
+from collections import Counter
+from itertools import chain
+from operator import itemgetter
 from dotenv import load_dotenv
-import json
+import orjson
 import pandas as pd
 from datetime import datetime
 from typing import Dict, List, Tuple
 from topic_extractor import TopicExtractor
 
+load_dotenv()
+
 
 class DashboardGenerator:
     def __init__(self):
-        load_dotenv()
         self.dashboards_folder = "dashboards"
-        self.ensure_dashboards_folder()
+        self._extractor = None
     
     def ensure_dashboards_folder(self):
         """Create dashboards folder if it doesn't exist."""
-        if not os.path.exists(self.dashboards_folder):
-            os.makedirs(self.dashboards_folder)
+        os.makedirs(self.dashboards_folder, exist_ok=True)
     
     def generate_dashboard_data(self) -> str:
         """Generate dashboard data and save to timestamped folder."""
         timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
         dashboard_folder = os.path.join(self.dashboards_folder, f"analysis_{timestamp}")
+        # Also creates the dashboards folder itself (where the topic cache lives) on first use
         os.makedirs(dashboard_folder, exist_ok=True)
         
         # Extract topics using existing TopicExtractor
-        API_KEY = os.environ.get("GOOGLE_API_KEY")
-        extractor = TopicExtractor(api_key=API_KEY)
-        company_topics = extractor.generate_topics_from_milvus_data()
-        ergosign_company_topics = extractor.get_ergosign_topics()
+        company_topics, ergosign_company_topics = self._extract_topics()
 
         if not company_topics:
             raise Exception("No topics extracted from CSV files")
@@ -41,37 +44,66 @@ class DashboardGenerator:
         
         return dashboard_folder
     
-    def _create_dashboard_data(self, company_topics: Dict[str, List[str]], ergosign_company_topics) -> Dict:
-        """Create structured dashboard data from company topics."""
-        # Get Ergosign topics (main company)
-        ergosign_topics = set()
-        competitor_topics = set()
+    def _get_extractor(self) -> TopicExtractor:
+        """Create the TopicExtractor on first use and share it across dashboards."""
+        if self._extractor is None:
+            self._extractor = TopicExtractor(api_key=os.environ.get("GOOGLE_API_KEY"))
+        return self._extractor
+    
+    def _extract_topics(self) -> Tuple[Dict[str, List[str]], List[str]]:
+        """Extract company and Ergosign topics, reusing the cached result if the source data is unchanged."""
+        extractor = self._get_extractor()
+        fingerprint = orjson.dumps(extractor.get_data_fingerprint(), option=orjson.OPT_SORT_KEYS)
+        cache_path = os.path.join(self.dashboards_folder, f"_topic_cache_{hashlib.sha256(fingerprint).hexdigest()[:16]}.json")
+        
+        if os.path.exists(cache_path):
+            print(f"✅ Source data unchanged, reusing topics from {cache_path}")
+            with open(cache_path, 'rb') as f:
+                cached = orjson.loads(f.read())
+            return cached['company_topics'], cached['ergosign_topics']
         
-        for topics in ergosign_company_topics:
-                ergosign_topics.update(topics)
-
-        for company, topics in company_topics.items():
-                competitor_topics.update(topics)
-
+        company_topics = extractor.generate_topics_from_milvus_data()
+        ergosign_topics = extractor.get_ergosign_topics()
+        
+        # Placeholder topics mean Gemini failed for someone; don't pin that result until the data changes
+        used_fallback = (
+            any(extractor.used_fallback(company, topics) for company, topics in company_topics.items())
+            or extractor.used_fallback("Ergosign", ergosign_topics)
+        )
+        
+        if company_topics and not used_fallback:
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps({'company_topics': company_topics, 'ergosign_topics': ergosign_topics}))
+        
+        return company_topics, ergosign_topics
+    
+    def _create_dashboard_data(self, company_topics: Dict[str, List[str]], ergosign_company_topics: List[str]) -> Dict:
+        """Create structured dashboard data from company topics."""
+        # Get Ergosign topics (main company) and competitor topics as unique indexes,
+        # so the set operations below run on pandas' hash tables
+        ergosign_topics = pd.Index(ergosign_company_topics, dtype=object).unique()
+        competitor_topics = pd.Index(list(chain.from_iterable(company_topics.values())), dtype=object).unique()
         
         # Calculate gaps and coverage
         all_topics = ergosign_topics.union(competitor_topics)
-        gaps = competitor_topics - ergosign_topics
+        gaps = competitor_topics.difference(ergosign_topics)
         coverage = ergosign_topics.intersection(competitor_topics)
         
         # Create summary metrics
         total_companies = len(company_topics)
         total_topics = len(all_topics)
         gap_opportunities = len(gaps)
-        coverage_percentage = round((len(coverage) / len(all_topics)) * 100, 1) if all_topics else 0
+        coverage_percentage = round((len(coverage) / len(all_topics)) * 100, 1) if len(all_topics) else 0
         
         # Topic distribution
-        ergosign_percentage = round((len(ergosign_topics) / len(all_topics)) * 100) if all_topics else 0
+        ergosign_percentage = round((len(ergosign_topics) / len(all_topics)) * 100) if len(all_topics) else 0
         competitor_percentage = 100 - ergosign_percentage
         
-        # Gap priority (simplified)
-        high_priority_gaps = list(gaps)[:3] if len(gaps) >= 3 else list(gaps)
-        medium_priority_gaps = list(gaps)[3:7] if len(gaps) > 3 else []
+        # Gap priority: rank by how many competitors cover the topic (ties alphabetically)
+        prevalence = Counter(topic for topics in company_topics.values() for topic in set(topics))
+        ranked_gaps = sorted(gaps, key=lambda topic: (-prevalence[topic], topic))
+        high_priority_gaps = ranked_gaps[:3]
+        medium_priority_gaps = ranked_gaps[3:7]
         
         return {
             'metadata': {
@@ -98,10 +130,10 @@ class DashboardGenerator:
                 'total_gaps': len(gaps)
             },
             'detailed_data': {
-                'ergosign_topics': list(ergosign_topics),
-                'competitor_topics': list(competitor_topics),
-                'coverage_topics': list(coverage),
-                'gap_topics': list(gaps),
+                'ergosign_topics': ergosign_topics.tolist(),
+                'competitor_topics': competitor_topics.tolist(),
+                'coverage_topics': coverage.tolist(),
+                'gap_topics': ranked_gaps,
                 'company_topics': company_topics
             }
         }
@@ -109,30 +141,27 @@ class DashboardGenerator:
     def _save_dashboard_files(self, folder: str, data: Dict, timestamp: str):
         """Save dashboard data to multiple files."""
         # Main dashboard data (JSON)
-        with open(os.path.join(folder, 'dashboard_data.json'), 'w') as f:
-            json.dump(data, f, indent=2)
+        with open(os.path.join(folder, 'dashboard_data.json'), 'wb') as f:
+            f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2))
         
         # Summary metrics (CSV)
-        summary_df = pd.DataFrame([data['summary_metrics']])
-        summary_df.to_csv(os.path.join(folder, 'summary_metrics.csv'), index=False)
+        summary = data['summary_metrics']
+        self._write_csv(os.path.join(folder, 'summary_metrics.csv'), list(summary.keys()), [list(summary.values())])
         
         # Topics by company (CSV)
-        topics_df = pd.DataFrame([
-            {'Company': company, 'Topic_Count': count, 'Topics': ', '.join(data['detailed_data']['company_topics'][company])}
-            for company, count in data['topics_by_company'].items()
-        ])
-        topics_df.to_csv(os.path.join(folder, 'topics_by_company.csv'), index=False)
+        self._write_csv(
+            os.path.join(folder, 'topics_by_company.csv'),
+            ['Company', 'Topic_Count', 'Topics'],
+            [[company, len(topics), ', '.join(topics)]
+             for company, topics in data['detailed_data']['company_topics'].items()]
+        )
         
         # Gap analysis (CSV)
-        gaps_data = []
-        for gap in data['gap_analysis']['high_priority']:
-            gaps_data.append({'Topic': gap, 'Priority': 'High'})
-        for gap in data['gap_analysis']['medium_priority']:
-            gaps_data.append({'Topic': gap, 'Priority': 'Medium'})
+        gaps_rows = [[gap, 'High'] for gap in data['gap_analysis']['high_priority']]
+        gaps_rows += [[gap, 'Medium'] for gap in data['gap_analysis']['medium_priority']]
         
-        if gaps_data:
-            gaps_df = pd.DataFrame(gaps_data)
-            gaps_df.to_csv(os.path.join(folder, 'gap_opportunities.csv'), index=False)
+        if gaps_rows:
+            self._write_csv(os.path.join(folder, 'gap_opportunities.csv'), ['Topic', 'Priority'], gaps_rows)
         
         # Metadata (TXT)
         with open(os.path.join(folder, 'analysis_info.txt'), 'w') as f:
@@ -141,22 +170,31 @@ class DashboardGenerator:
             f.write(f"Companies Analyzed: {data['metadata']['companies_analyzed']}\n")
             f.write(f"Total Topics Identified: {data['metadata']['total_topics']}\n")
     
+    @staticmethod
+    def _write_csv(path: str, header: List[str], rows: List[List]):
+        """Write a small CSV file directly, without building a DataFrame."""
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            writer = csv.writer(f, lineterminator='\n')
+            writer.writerow(header)
+            writer.writerows(rows)
+    
     def get_available_dashboards(self) -> List[Tuple[str, str]]:
         """Get list of available dashboard folders with timestamps."""
         dashboards = []
         if os.path.exists(self.dashboards_folder):
-            for folder in os.listdir(self.dashboards_folder):
-                if folder.startswith('analysis_'):
-                    timestamp_str = folder.replace('analysis_', '')
-                    try:
-                        # Parse timestamp for display
-                        dt = datetime.strptime(timestamp_str, "%Y%m%d_%H%M%S")
-                        display_name = dt.strftime("%Y-%m-%d %H:%M:%S")
-                        dashboards.append((folder, display_name))
-                    except ValueError:
-                        dashboards.append((folder, folder))
-        
-        return sorted(dashboards, key=lambda x: x[0], reverse=True)
+            with os.scandir(self.dashboards_folder) as entries:
+                folders = [entry.name for entry in entries if entry.is_dir() and entry.name.startswith('analysis_')]
+            
+            for folder in folders:
+                # Folder names carry a fixed-width YYYYMMDD_HHMMSS timestamp; slice it for display
+                ts = folder[len('analysis_'):]
+                if len(ts) == 15 and ts[8] == '_' and ts[:8].isdigit() and ts[9:].isdigit():
+                    display_name = f"{ts[:4]}-{ts[4:6]}-{ts[6:8]} {ts[9:11]}:{ts[11:13]}:{ts[13:15]}"
+                    dashboards.append((folder, display_name))
+                else:
+                    dashboards.append((folder, folder))
+        
+        return sorted(dashboards, key=itemgetter(0), reverse=True)
     
     def load_dashboard_data(self, dashboard_folder: str) -> Dict:
         """Load dashboard data from specified folder."""
@@ -165,5 +203,5 @@ class DashboardGenerator:
         if not os.path.exists(data_path):
             raise FileNotFoundError(f"Dashboard data not found: {data_path}")
         
-        with open(data_path, 'r') as f:
-            return json.load(f)
\ No newline at end of file
+        with open(data_path, 'rb') as f:
+            return orjson.loads(f.read())
\ No newline at end of file
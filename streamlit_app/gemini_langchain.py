@@ -5,18 +5,50 @@ with LangChain for advanced language model operations.
 """
 
 import os
+import hashlib
+import threading
+from collections import OrderedDict
+from types import MappingProxyType
 from typing import List, Optional, Dict, Any
 from dotenv import load_dotenv
 
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain.schema import BaseMessage, HumanMessage, AIMessage, SystemMessage
-from langchain.prompts import ChatPromptTemplate, SystemMessagePromptTemplate, HumanMessagePromptTemplate
-from langchain.chains import LLMChain, ConversationChain
-from langchain.memory import ConversationBufferMemory, ConversationSummaryBufferMemory
+from langchain.memory import ConversationSummaryBufferMemory
 from langchain.callbacks import StreamingStdOutCallbackHandler
 
+load_dotenv()
 
 
+# Responses of analyze_text / ask_with_context, shared by every client in the process.
+# Keys are digests of (model, temperature, system prompt, input) so large inputs aren't retained.
+_RESPONSE_CACHE_SIZE = 1024
+_RESPONSE_CACHE: "OrderedDict[bytes, str]" = OrderedDict()
+_RESPONSE_CACHE_LOCK = threading.Lock()
+
+# Lookup tables used by GeminiLangChain.analyze_text / generate_content
+_PROMPTS = MappingProxyType({
+    "general": "Analyze the following text and provide insights:",
+    "sentiment": "Analyze the sentiment of the following text:",
+    "summary": "Provide a concise summary of the following text:",
+    "keywords": "Extract key themes and keywords from the following text:",
+    "tone": "Analyze the tone and writing style of the following text:"
+})
+
+_LENGTH_GUIDELINES = MappingProxyType({
+    "short": "Write a brief, concise piece (200-300 words)",
+    "medium": "Write a comprehensive piece (500-800 words)",
+    "long": "Write a detailed, in-depth piece (1000+ words)"
+})
+
+_CONTENT_INSTRUCTIONS = MappingProxyType({
+    "article": "Write a well-structured article",
+    "blog": "Write an engaging blog post",
+    "social_post": "Write a social media post",
+    "email": "Write a professional email",
+    "report": "Write a detailed report"
+})
+
 
 class GeminiLangChain:
     """
@@ -30,7 +62,8 @@ class GeminiLangChain:
         model_name: str = "gemini-2.0-flash-exp",  # Updated to latest available model
         temperature: float = 0.7,
         max_output_tokens: Optional[int] = None,
-        streaming: bool = False
+        streaming: bool = False,
+        max_memory_tokens: int = 1500
     ):
         """
         Initialize the Gemini LangChain wrapper.
@@ -41,10 +74,12 @@ class GeminiLangChain:
             temperature: Sampling temperature (0.0 to 1.0)
             max_output_tokens: Maximum number of tokens to generate
             streaming: Whether to enable streaming responses
+            max_memory_tokens: Token budget for the conversation history; older turns
+                beyond it are folded into a running summary
         """
-        # Load environment variables
-        load_dotenv()
         self.api_key = api_key or os.getenv("GOOGLE_API_KEY")
+        self.model_name = model_name
+        self.temperature = temperature
         if not self.api_key:
             raise ValueError("Google API key is required. Set GOOGLE_API_KEY environment variable or pass api_key parameter.")
         
@@ -59,14 +94,11 @@ class GeminiLangChain:
             callbacks=[StreamingStdOutCallbackHandler()] if streaming else None
         )
         
-        # Initialize memory for conversation
-        self.memory = ConversationBufferMemory(return_messages=True)
-        
-        # Create conversation chain
-        self.conversation = ConversationChain(
+        # Initialize memory for conversation, bounded so prompts don't grow with every turn
+        self.memory = ConversationSummaryBufferMemory(
             llm=self.llm,
-            memory=self.memory,
-            verbose=False
+            max_token_limit=max_memory_tokens,
+            return_messages=True
         )
     
     def chat(self, message: str) -> str:
@@ -80,11 +112,28 @@ class GeminiLangChain:
             The AI's response
         """
         try:
-            response = self.conversation.predict(input=message)
+            history = self.memory.load_memory_variables({})["history"]
+            response = self.llm.invoke(history + [HumanMessage(content=message)]).content
+            self.memory.save_context({"input": message}, {"output": response})
             return response
         except Exception as e:
             return f"Error: {str(e)}"
     
+    def fast_chat(self, message: str) -> str:
+        """
+        One-shot chat without conversation memory.
+        
+        Args:
+            message: The user's message
+            
+        Returns:
+            The AI's response
+        """
+        try:
+            return self.llm.invoke([HumanMessage(content=message)]).content
+        except Exception as e:
+            return f"Error: {str(e)}"
+    
     def chat_with_system_prompt(self, message: str, system_prompt: str) -> str:
         """
         Chat with a custom system prompt.
@@ -97,22 +146,40 @@ class GeminiLangChain:
             The AI's response
         """
         try:
-            # Create a chat prompt template
-            chat_prompt = ChatPromptTemplate.from_messages([
-                SystemMessagePromptTemplate.from_template(system_prompt),
-                HumanMessagePromptTemplate.from_template("{input}")
+            response = self.llm.invoke([
+                SystemMessage(content=system_prompt),
+                HumanMessage(content=message)
             ])
-            
-            # Create chain with custom prompt
-            chain = LLMChain(llm=self.llm, prompt=chat_prompt)
-            response = chain.run(input=message)
-            return response
+            return response.content
         except Exception as e:
             return f"Error: {str(e)}"
     
+    def _cached_chat_with_system_prompt(self, message: str, system_prompt: str) -> str:
+        """chat_with_system_prompt, memoized on a digest of the model settings and inputs."""
+        key = hashlib.blake2b(
+            "\x00".join([self.model_name, str(self.temperature), system_prompt, message]).encode("utf-8"),
+            digest_size=16
+        ).digest()
+        
+        with _RESPONSE_CACHE_LOCK:
+            if key in _RESPONSE_CACHE:
+                _RESPONSE_CACHE.move_to_end(key)
+                return _RESPONSE_CACHE[key]
+        
+        response = self.chat_with_system_prompt(message, system_prompt)
+        
+        # Don't cache failures, so the next call retries
+        if not response.startswith("Error:"):
+            with _RESPONSE_CACHE_LOCK:
+                _RESPONSE_CACHE[key] = response
+                if len(_RESPONSE_CACHE) > _RESPONSE_CACHE_SIZE:
+                    _RESPONSE_CACHE.popitem(last=False)
+        return response
+    
     def analyze_text(self, text: str, analysis_type: str = "general") -> str:
         """
-        Analyze text with specific focus.
+        Analyze text with specific focus. Repeated calls with the same input
+        return the cached response.
         
         Args:
             text: Text to analyze
@@ -121,16 +188,8 @@ class GeminiLangChain:
         Returns:
             Analysis results
         """
-        prompts = {
-            "general": "Analyze the following text and provide insights:",
-            "sentiment": "Analyze the sentiment of the following text:",
-            "summary": "Provide a concise summary of the following text:",
-            "keywords": "Extract key themes and keywords from the following text:",
-            "tone": "Analyze the tone and writing style of the following text:"
-        }
-        
-        system_prompt = prompts.get(analysis_type, prompts["general"])
-        return self.chat_with_system_prompt(text, system_prompt)
+        system_prompt = _PROMPTS.get(analysis_type, _PROMPTS["general"])
+        return self._cached_chat_with_system_prompt(text, system_prompt)
     
     def generate_content(self, topic: str, content_type: str = "article", length: str = "medium") -> str:
         """
@@ -144,23 +203,9 @@ class GeminiLangChain:
         Returns:
             Generated content
         """
-        length_guidelines = {
-            "short": "Write a brief, concise piece (200-300 words)",
-            "medium": "Write a comprehensive piece (500-800 words)",
-            "long": "Write a detailed, in-depth piece (1000+ words)"
-        }
-        
-        content_instructions = {
-            "article": "Write a well-structured article",
-            "blog": "Write an engaging blog post",
-            "social_post": "Write a social media post",
-            "email": "Write a professional email",
-            "report": "Write a detailed report"
-        }
-        
         system_prompt = f"""
-        {content_instructions.get(content_type, 'Write content')} about the topic: {topic}.
-        {length_guidelines.get(length, 'Write appropriately sized content')}.
+        {_CONTENT_INSTRUCTIONS.get(content_type, 'Write content')} about the topic: {topic}.
+        {_LENGTH_GUIDELINES.get(length, 'Write appropriately sized content')}.
         Make it engaging, informative, and well-structured.
         """
         
@@ -168,7 +213,8 @@ class GeminiLangChain:
     
     def ask_with_context(self, question: str, context: str) -> str:
         """
-        Ask a question with additional context.
+        Ask a question with additional context. Repeated calls with the same
+        question and context return the cached response.
         
         Args:
             question: The question to ask
@@ -186,7 +232,7 @@ class GeminiLangChain:
         contain enough information, mention what additional information would be helpful.
         """
         
-        return self.chat_with_system_prompt(question, system_prompt)
+        return self._cached_chat_with_system_prompt(question, system_prompt)
     
     def clear_memory(self):
         """Clear the conversation memory."""
@@ -196,25 +242,41 @@ class GeminiLangChain:
         """Get the current conversation history."""
         return self.memory.chat_memory.messages
     
-    def batch_process(self, prompts: List[str]) -> List[str]:
+    def batch_process(self, prompts: List[str], max_concurrency: int = 10) -> List[str]:
         """
-        Process multiple prompts in batch.
+        Process multiple prompts in batch, sending up to max_concurrency requests at once.
         
         Args:
             prompts: List of prompts to process
+            max_concurrency: Maximum number of concurrent Gemini requests
             
         Returns:
-            List of responses
+            List of responses, in the same order as prompts
         """
-        responses = []
-        for prompt in prompts:
-            try:
-                response = self.llm.predict(prompt)
-                responses.append(response)
-            except Exception as e:
-                responses.append(f"Error processing prompt: {str(e)}")
+        results = self.llm.batch(prompts, config={"max_concurrency": max_concurrency}, return_exceptions=True)
+        return self._batch_responses(results)
+    
+    async def abatch_process(self, prompts: List[str], max_concurrency: int = 10) -> List[str]:
+        """
+        Async version of batch_process.
         
-        return responses
+        Args:
+            prompts: List of prompts to process
+            max_concurrency: Maximum number of concurrent Gemini requests
+            
+        Returns:
+            List of responses, in the same order as prompts
+        """
+        results = await self.llm.abatch(prompts, config={"max_concurrency": max_concurrency}, return_exceptions=True)
+        return self._batch_responses(results)
+    
+    @staticmethod
+    def _batch_responses(results: List[Any]) -> List[str]:
+        """Turn batch results into response strings, keeping per-prompt errors in place."""
+        return [
+            f"Error processing prompt: {str(result)}" if isinstance(result, Exception) else result.content
+            for result in results
+        ]
 
 
 class GeminiChainBuilder:
@@ -6,6 +6,8 @@ import os
 from topic_extractor import TopicExtractor
 from dotenv import load_dotenv
 
+load_dotenv()
+
 def main():
     """
     Run the complete topic analysis process.
@@ -20,7 +22,6 @@ def main():
     print("5. Output missing topics to 'ergosign_missing_topics.txt'")
     print("\n" + "=" * 50)
     
-    load_dotenv()
     # Load environment variables
     API_KEY = os.environ.get("GOOGLE_API_KEY")
     
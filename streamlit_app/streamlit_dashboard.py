@@ -1,10 +1,101 @@
 import streamlit as st
 import plotly.graph_objects as go
-import plotly.express as px
-import pandas as pd
 from dashboard_generator import DashboardGenerator
 from datetime import datetime
 
+# Streamlit re-runs this script on every interaction. Dashboard folders never change once
+# written, so their data and figures are cached by folder name; the folder list is
+# refreshed on a short TTL (and cleared after generating a new analysis).
+
+@st.cache_resource
+def get_generator():
+    # One generator per server process, so its TopicExtractor (Gemini and Milvus clients)
+    # survives reruns instead of being rebuilt on every interaction
+    return DashboardGenerator()
+
+@st.cache_data(ttl=30)
+def list_dashboards():
+    return get_generator().get_available_dashboards()
+
+@st.cache_data
+def load_dashboard(dashboard_folder):
+    return get_generator().load_dashboard_data(dashboard_folder)
+
+@st.cache_data
+def build_donut_chart(dashboard_folder, _data):
+    fig_donut = go.Figure(data=[go.Pie(
+        labels=['Ergosign', 'Competitors'],
+        values=[_data['topic_distribution']['ergosign_percentage'], 
+               _data['topic_distribution']['competitor_percentage']],
+        hole=0.4,
+        marker_colors=['#5E81AC', '#BF616A']
+    )])
+    
+    fig_donut.update_layout(
+        showlegend=True,
+        height=300,
+        margin=dict(t=0, b=0, l=0, r=0)
+    )
+    return fig_donut
+
+@st.cache_data
+def build_company_chart(dashboard_folder, _data):
+    companies = list(_data['topics_by_company'].keys())
+    topic_counts = list(_data['topics_by_company'].values())
+    
+    fig_bar = go.Figure(data=[
+        go.Bar(
+            x=companies,
+            y=topic_counts,
+            marker_color=['#5E81AC' if 'ergosign' in comp.lower() else '#D8DEE9' for comp in companies]
+        )
+    ])
+    
+    fig_bar.update_layout(
+        height=300,
+        margin=dict(t=0, b=0, l=0, r=0),
+        xaxis_title="",
+        yaxis_title=""
+    )
+    return fig_bar
+
+# (gap_analysis key, bar label, bar colour) for the gap priority chart
+GAP_PRIORITIES = (
+    ('high_priority', 'High Priority', '#D08770'),
+    ('medium_priority', 'Medium Priority', '#EBCB8B')
+)
+
+@st.cache_data
+def build_gap_chart(dashboard_folder, _data):
+    """Return the gap priority chart, or None if there are no gaps."""
+    counts = [len(_data['gap_analysis'][key]) for key, _, _ in GAP_PRIORITIES]
+    
+    if sum(counts) == 0:
+        return None
+    
+    # Only priorities that actually have gaps get a bar
+    labels, counts, colors = map(list, zip(*(
+        (label, count, color) for (_, label, color), count in zip(GAP_PRIORITIES, counts) if count
+    )))
+    
+    fig_gaps = go.Figure(data=[
+        go.Bar(
+            x=labels,
+            y=counts,
+            text=counts,
+            textposition='auto',
+            marker_color=colors
+        )
+    ])
+    
+    fig_gaps.update_layout(
+        height=200,
+        margin=dict(t=0, b=0, l=0, r=0),
+        xaxis_title="",
+        yaxis_title=""
+    )
+    return fig_gaps
+
 def main():
     st.set_page_config(
         page_title="Ergosign Topic Gap Analysis Dashboard",
@@ -15,7 +106,7 @@ def main():
     st.title("📊 Ergosign Topic Gap Analysis Dashboard")
     
     # Initialize dashboard generator
-    generator = DashboardGenerator()
+    generator = get_generator()
     
     # Sidebar controls
     st.sidebar.header("Dashboard Controls")
@@ -26,12 +117,13 @@ def main():
             try:
                 folder = generator.generate_dashboard_data()
                 st.sidebar.success(f"Analysis generated: {folder}")
+                list_dashboards.clear()
                 st.rerun()
             except Exception as e:
                 st.sidebar.error(f"Error: {str(e)}")
     
     # Dashboard selection
-    available_dashboards = generator.get_available_dashboards()
+    available_dashboards = list_dashboards()
     
     if not available_dashboards:
         st.warning("No dashboard data available. Generate a new analysis first.")
@@ -46,12 +138,12 @@ def main():
     
     # Load and display dashboard
     try:
-        data = generator.load_dashboard_data(selected_dashboard)
-        display_dashboard(data)
+        data = load_dashboard(selected_dashboard)
+        display_dashboard(selected_dashboard, data)
     except Exception as e:
         st.error(f"Error loading dashboard: {str(e)}")
 
-def display_dashboard(data):
+def display_dashboard(dashboard_folder, data):
     """Display the dashboard using the loaded data."""
     
     # Header with last updated info
@@ -100,77 +192,21 @@ def display_dashboard(data):
         # Topics Distribution Donut Chart
         st.subheader("Topics Distribution")
         
-        fig_donut = go.Figure(data=[go.Pie(
-            labels=['Ergosign', 'Competitors'],
-            values=[data['topic_distribution']['ergosign_percentage'], 
-                   data['topic_distribution']['competitor_percentage']],
-            hole=0.4,
-            marker_colors=['#5E81AC', '#BF616A']
-        )])
-        
-        fig_donut.update_layout(
-            showlegend=True,
-            height=300,
-            margin=dict(t=0, b=0, l=0, r=0)
-        )
-        
-        st.plotly_chart(fig_donut, use_container_width=True)
+        st.plotly_chart(build_donut_chart(dashboard_folder, data), use_container_width=True)
         st.caption("[Donut Chart Visual]")
     
     with col2:
         # Topics by Company Bar Chart
         st.subheader("Topics by Company")
         
-        companies = list(data['topics_by_company'].keys())
-        topic_counts = list(data['topics_by_company'].values())
-        
-        fig_bar = go.Figure(data=[
-            go.Bar(
-                x=companies,
-                y=topic_counts,
-                marker_color=['#5E81AC' if 'ergosign' in comp.lower() else '#D8DEE9' for comp in companies]
-            )
-        ])
-        
-        fig_bar.update_layout(
-            height=300,
-            margin=dict(t=0, b=0, l=0, r=0),
-            xaxis_title="",
-            yaxis_title=""
-        )
-        
-        st.plotly_chart(fig_bar, use_container_width=True)
+        st.plotly_chart(build_company_chart(dashboard_folder, data), use_container_width=True)
     
     # Gap Opportunities Priority
     st.subheader("Gap Opportunities Priority")
     
-    gap_data = []
-    for gap in data['gap_analysis']['high_priority']:
-        gap_data.append({'Priority': 'High Priority', 'Count': 1})
-    for gap in data['gap_analysis']['medium_priority']:
-        gap_data.append({'Priority': 'Medium Priority', 'Count': 1})
+    fig_gaps = build_gap_chart(dashboard_folder, data)
     
-    if gap_data:
-        gap_df = pd.DataFrame(gap_data)
-        gap_summary = gap_df.groupby('Priority')['Count'].sum().reset_index()
-        
-        fig_gaps = go.Figure(data=[
-            go.Bar(
-                x=gap_summary['Priority'],
-                y=gap_summary['Count'],
-                text=gap_summary['Count'],
-                textposition='auto',
-                marker_color=['#D08770', '#EBCB8B']
-            )
-        ])
-        
-        fig_gaps.update_layout(
-            height=200,
-            margin=dict(t=0, b=0, l=0, r=0),
-            xaxis_title="",
-            yaxis_title=""
-        )
-        
+    if fig_gaps is not None:
         st.plotly_chart(fig_gaps, use_container_width=True)
     else:
         st.info("No gap opportunities identified")
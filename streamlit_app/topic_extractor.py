@@ -4,29 +4,147 @@ This module extracts unique topics from competitor CSV files and compares them w
 """
 
 import os
+import atexit
+import json
+import configparser
 from dotenv import load_dotenv
 import pandas as pd
-import glob
 from typing import List, Dict, Set
 import re
+from collections import defaultdict
+from itertools import chain
+from functools import lru_cache
+from concurrent.futures import ThreadPoolExecutor
+import tiktoken
 from pymilvus import connections, Collection
 from gemini_langchain import GeminiLangChain
 from datetime import datetime, timedelta
 
+load_dotenv()
+
+_WS = re.compile(r'\s+')
+# A line starting with a digit or "-" (e.g. "1. [Topic]", "2) Topic", "- Topic", "3 Topic");
+# captures the text after the leading list markers
+_LIST_ITEM = re.compile(r'^[^\S\n]*[\d-][\d\-.) \t]*([^\d\-.)\s].*?)[^\S\n]*$', re.M)
+# Square brackets wrapped around a topic, as in the "1. [Specific Topic]" response format
+_BRACKETS = re.compile(r'^\[|\]$')
+
+# Navigation, cookie and sharing boilerplate that scraped pages often carry; dropped before truncation
+_BOILERPLATE = re.compile(
+    r'\b(?:skip to (?:main )?content|accept (?:all )?cookies|cookie (?:settings|policy|preferences)|'
+    r'privacy policy|terms of (?:use|service)|all rights reserved|subscribe to our newsletter|'
+    r'share (?:on|via) (?:facebook|twitter|linkedin|x|email)|read more|back to top)\b[.:]?',
+    re.I
+)
+
+# Token budget for the content sent to Gemini per company
+MAX_TOPIC_INPUT_TOKENS = 3000
+
+@lru_cache(maxsize=1)
+def _get_encoding():
+    # Loaded on first use; tiktoken downloads the BPE ranks the first time, which can fail
+    # offline. The failure is cached too, so later calls don't wait on the network again
+    try:
+        return tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        print(f"⚠️  Could not load tiktoken encoding, truncating by characters instead: {str(e)}")
+        return None
+
+def _truncate_to_tokens(text: str, max_tokens: int) -> str:
+    """Cut text to at most max_tokens tokens (cl100k_base, a close proxy for Gemini's tokenizer).
+    Without the encoding, falls back to ~4 characters per token."""
+    encoding = _get_encoding()
+    if encoding is None:
+        return text[:max_tokens * 4]
+    # A token is rarely longer than 8 characters, so there's no need to encode anything past that
+    text = text[:max_tokens * 8]
+    tokens = encoding.encode(text, disallowed_special=())
+    return encoding.decode(tokens[:max_tokens]) if len(tokens) > max_tokens else text
+
+@lru_cache(maxsize=1)
+def _get_collection() -> Collection:
+    # One connection per process, shared by every TopicExtractor and closed at exit
+    connections.connect(
+    alias="default",
+    uri=os.environ.get("ZILLIZ_URI"),
+    token=os.environ.get("ZILLIZ_TOKEN"))
+    atexit.register(connections.disconnect, "default")
+    return Collection(os.environ.get("COLLECTION_NAME"))
+
+# Instructions for extract_topics_from_text, sent unchanged for every company
+_TOPIC_SYSTEM_PROMPT = """You are an expert business content analyst. Analyze the provided text content from a company's website, blog, articles, and case studies.
+
+Extract exactly 5 unique, specific topics that this company specializes in or writes about.
+
+CRITICAL REQUIREMENTS:
+1. Topics must be SPECIFIC and CONCRETE (examples: "AI-Powered UX Design", "Voice User Interfaces", "E-commerce Optimization")
+2. NOT generic terms (avoid: "technology", "business", "innovation", "solutions")
+3. Each topic should be 2-4 words
+4. Topics must be DIFFERENT from each other
+5. Focus on the company's actual services, expertise, or specializations
+6. Base topics on what you actually read in the content
+
+RESPONSE FORMAT - EXACTLY like this:
+1. [Specific Topic]
+2. [Specific Topic]
+3. [Specific Topic]
+4. [Specific Topic]
+5. [Specific Topic]
+
+NO additional text, explanations, or formatting."""
+
+_TOPIC_USER_TMPL = "Company: {company_name}\n\nContent to analyze:\n{text}"
+
+# Only blogs scraped within this window are analyzed (3 months ≈ 90 days)
+MILVUS_LOOKBACK_DAYS = 90
+
+# Rows fetched per Milvus round-trip while paging through query results
+MILVUS_QUERY_BATCH_SIZE = 1000
+
+def _fallback_topics(company_name: str) -> List[str]:
+    """Placeholder topics used when Gemini gives no usable answer for a company."""
+    return [
+        f"{company_name.title()} Digital Services",
+        f"{company_name.title()} UX Design",
+        f"{company_name.title()} Technology Solutions",
+        f"{company_name.title()} Innovation Strategy",
+        f"{company_name.title()} Business Consulting"
+    ]
+
+# Competitors scraped by the data_adapter DAG; their names are the company_name values in Milvus
+COMPANIES_CONFIG = os.environ.get(
+    "COMPANIES_CONFIG",
+    os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data_adapter", "companies.config")
+)
+
+def load_competitors() -> List[str]:
+    """Company names from the scraper's companies.config, or None if it isn't available."""
+    config = configparser.ConfigParser()
+    if not config.read(COMPANIES_CONFIG) or "companies" not in config:
+        return None
+    return list(config["companies"])
+
+def _lookback_cutoff() -> int:
+    """Start of the lookback window as epoch microseconds, the unit of the timestamp field."""
+    return int((datetime.now() - timedelta(days=MILVUS_LOOKBACK_DAYS)).timestamp() * 1_000_000)
+
 class TopicExtractor:
     """
     Extracts and analyzes topics from CSV files using Gemini 2.5 Pro.
     """
     
-    def __init__(self, api_key: str = None):
+    def __init__(self, api_key: str = None, max_workers: int = 8):
         """
         Initialize the TopicExtractor with Gemini client.
         
         Args:
             api_key: Google API key for Gemini
+            max_workers: Number of companies whose topics are extracted concurrently
         """
-        load_dotenv()
         self.gemini = GeminiLangChain(api_key=api_key, temperature=0.3)
+        self.max_workers = max_workers
+        # Known competitors let Milvus be queried one partition at a time; None falls back to one window scan
+        self.companies = load_competitors()
         self.data_folder = "data"
         self.ergosign_file = "ergosign.de_scraped_data.csv"
         
@@ -38,8 +156,15 @@ class TopicExtractor:
         Returns:
             List of CSV file paths
         """
-        csv_pattern = os.path.join(self.data_folder, "*.csv")
-        csv_files = glob.glob(csv_pattern)
+        # One directory read; DirEntry answers is_file() without an extra stat on most platforms.
+        # Hidden files are skipped, as "*.csv" globbing did
+        csv_files = []
+        if os.path.isdir(self.data_folder):
+            with os.scandir(self.data_folder) as entries:
+                csv_files = sorted(
+                    entry.path for entry in entries
+                    if entry.name.endswith(".csv") and not entry.name.startswith(".") and entry.is_file()
+                )
         
         if not csv_files:
             print(f"❌ No CSV files found in '{self.data_folder}' folder")
@@ -51,33 +176,70 @@ class TopicExtractor:
         
         return csv_files
     
-    def get_milvus_data(self):
-        connections.connect(
-        alias="default",
-        uri=os.environ.get("ZILLIZ_URI"),
-        token=os.environ.get("ZILLIZ_TOKEN"))
-        collection = Collection(os.environ.get("COLLECTION_NAME"))
-        results = collection.query(expr="id >= 0",output_fields=["timestamp", "title", "body", "company_name"])
-        data = {}
-
-        # today's date
-        now = datetime.now()
-
-        # 3 months ≈ 90 days (simple approximation)
-        three_months_ago = now - timedelta(days=90)
-
-        for row in results:
-            ts = datetime.strptime(row["timestamp"], "%Y-%m-%d %H:%M:%S.%f")
-            if ts >= three_months_ago :
-                if row["company_name"] not in data.keys():
-                    data[row["company_name"]] = row["title"] + " " + row["body"]
-                else:
-                    data[row["company_name"]] += "\n\n" + row["title"] + " " + row["body"]
+    def _query_batches(self, collection: Collection, expr: str, output_fields: List[str]):
+        """Yield query results page by page, so no single response has to hold the whole result."""
+        iterator = collection.query_iterator(batch_size=MILVUS_QUERY_BATCH_SIZE, expr=expr, output_fields=output_fields)
+        try:
+            while True:
+                batch = iterator.next()
+                if not batch:
+                    break
+                yield batch
+        finally:
+            iterator.close()
 
-            else:
-                continue
-            
-        return data
+    def get_data_fingerprint(self) -> Dict:
+        """
+        Summarize the inputs of a topic extraction run without reading the blog text.
+        
+        Returns:
+            Dictionary that changes whenever the extracted topics could change
+        """
+        collection = _get_collection()
+        ergosign_path = os.path.join(self.data_folder, self.ergosign_file)
+        ergosign_stat = os.stat(ergosign_path) if os.path.exists(ergosign_path) else None
+        
+        return {
+            'milvus_entities': collection.num_entities,
+            # Only rows inside the lookback window feed the topics, so there's no need to scan older ones
+            'milvus_latest_timestamp': max(
+                (row["timestamp"] for batch in self._query_batches(collection, f"timestamp >= {_lookback_cutoff()}", ["timestamp"]) for row in batch),
+                default=None
+            ),
+            'lookback_start': (datetime.now() - timedelta(days=MILVUS_LOOKBACK_DAYS)).date().isoformat(),
+            'ergosign_file': [ergosign_stat.st_mtime_ns, ergosign_stat.st_size] if ergosign_stat else None,
+            # How the topics are asked for, so changing the prompt, model or input budget invalidates old results
+            'topic_prompt': [_TOPIC_SYSTEM_PROMPT, _TOPIC_USER_TMPL],
+            'topic_model': [self.gemini.model_name, self.gemini.temperature],
+            # Token budget, and whether it's counted in real tokens or by the character fallback
+            'max_input_tokens': [MAX_TOPIC_INPUT_TOKENS, _get_encoding() is not None],
+            'companies': self.companies
+        }
+    
+    def get_milvus_data(self, companies: List[str] = None):
+        collection = _get_collection()
+
+        # Only recent blogs are fetched; timestamps are INT64 epoch microseconds
+        cutoff = _lookback_cutoff()
+        output_fields = ["title", "body", "company_name"]
+
+        if companies is not None:
+            # company_name is the partition key, so each query only scans that company's partition
+            def company_text(company_name):
+                expr = f"company_name == {json.dumps(company_name)} && timestamp >= {cutoff}"
+                parts = [f"{row['title']} {row['body']}" for batch in self._query_batches(collection, expr, output_fields) for row in batch]
+                return company_name, "\n\n".join(parts)
+
+            with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+                return {company_name: text for company_name, text in executor.map(company_text, companies) if text}
+
+        # Collect each company's blog texts as list items and join once at the end
+        texts = defaultdict(list)
+        for batch in self._query_batches(collection, f"timestamp >= {cutoff}", output_fields):
+            for row in batch:
+                texts[row["company_name"]].append(f"{row['title']} {row['body']}")
+
+        return {company_name: "\n\n".join(parts) for company_name, parts in texts.items()}
 
     def read_csv_content(self, csv_file: str) -> str:
         """
@@ -90,40 +252,41 @@ class TopicExtractor:
             Combined text content from Title and Content columns
         """
         try:
-            df = pd.read_csv(csv_file)
-            
-            # Only read Title and Content columns, ignore URL and other columns
-            text_content = ""
+            # Find the Title and Content columns (case insensitive) from the header alone,
+            # then parse only those; URL and other columns are never read into memory
+            columns = pd.read_csv(csv_file, nrows=0).columns
             
-            # Check for Title column (case insensitive)
             title_col = None
             content_col = None
             
-            for col in df.columns:
+            for col in columns:
                 if col.lower().strip('"') in ['title']:
                     title_col = col
                 elif col.lower().strip('"') in ['content']:
                     content_col = col
             
+            if not title_col and not content_col:
+                print(f"⚠️  No Title or Content columns found in {os.path.basename(csv_file)}")
+                print(f"Available columns: {list(columns)}")
+                return ""
+            
+            df = pd.read_csv(csv_file, usecols=[col for col in (title_col, content_col) if col is not None], dtype=str)
+            text_parts = []
+            
             if title_col is not None:
-                titles = df[title_col].dropna().astype(str)
-                title_text = ' '.join(titles.tolist())
-                text_content += f" {title_text}"
+                titles = df[title_col].dropna()
+                text_parts.append(titles.str.cat(sep=' '))
                 print(f"✅ Found {len(titles)} titles")
             
             if content_col is not None:
-                contents = df[content_col].dropna().astype(str)
-                content_text = ' '.join(contents.tolist())
-                text_content += f" {content_text}"
+                contents = df[content_col].dropna()
+                text_parts.append(contents.str.cat(sep=' '))
                 print(f"✅ Found {len(contents)} content entries")
             
-            if not title_col and not content_col:
-                print(f"⚠️  No Title or Content columns found in {os.path.basename(csv_file)}")
-                print(f"Available columns: {list(df.columns)}")
-                return ""
+            text_content = ' '.join(text_parts)
             
             # Clean the text
-            text_content = re.sub(r'\s+', ' ', text_content.strip())
+            text_content = _WS.sub(' ', text_content.strip())
             
             print(f"✅ Read {len(text_content)} characters from {os.path.basename(csv_file)}")
             return text_content
@@ -143,53 +306,18 @@ class TopicExtractor:
         Returns:
             List of 5 unique topics
         """
-        system_prompt = """
-        You are an expert business content analyst. Analyze the provided text content from a company's website, blog, articles, and case studies.
-        
-        Extract exactly 5 unique, specific topics that this company specializes in or writes about.
-        
-        CRITICAL REQUIREMENTS:
-        1. Topics must be SPECIFIC and CONCRETE (examples: "AI-Powered UX Design", "Voice User Interfaces", "E-commerce Optimization")
-        2. NOT generic terms (avoid: "technology", "business", "innovation", "solutions")
-        3. Each topic should be 2-4 words
-        4. Topics must be DIFFERENT from each other
-        5. Focus on the company's actual services, expertise, or specializations
-        6. Base topics on what you actually read in the content
-        
-        RESPONSE FORMAT - EXACTLY like this:
-        1. [Specific Topic]
-        2. [Specific Topic] 
-        3. [Specific Topic]
-        4. [Specific Topic]
-        5. [Specific Topic]
-        
-        NO additional text, explanations, or formatting.
-        """
-        
-        # Limit text but ensure we get meaningful content
-        text_sample = text[:12000] if len(text) > 12000 else text
-        
-        user_message = f"""
-        Company: {company_name}
-        
-        Content to analyze:
-        {text_sample}
-        """
-        
         try:
-            print(f"🤖 Asking Gemini to analyze {company_name} content...")
-            
-            # Use a combined prompt instead of system + user message
-            combined_prompt = f"""
-            {system_prompt}
+            # Drop boilerplate, then limit by tokens (what Gemini latency scales with) rather than characters
+            text_sample = _truncate_to_tokens(_WS.sub(' ', _BOILERPLATE.sub(' ', text)).strip(), MAX_TOPIC_INPUT_TOKENS)
             
-            Company: {company_name}
-            
-            Content to analyze:
-            {text_sample}
-            """
+            print(f"🤖 Asking Gemini to analyze {company_name} content...")
             
-            response = self.gemini.chat(combined_prompt)
+            # Stateless call: companies are analyzed concurrently and must not share history.
+            # The instructions go out as the (identical) system message on every call
+            response = self.gemini.chat_with_system_prompt(
+                _TOPIC_USER_TMPL.format(company_name=company_name, text=text_sample),
+                _TOPIC_SYSTEM_PROMPT
+            )
             
             print(f"🔍 Raw Gemini response for {company_name}:")
             print(f"'{response[:200]}...'")
@@ -197,27 +325,15 @@ class TopicExtractor:
             # Check if we got an error response
             if "Error:" in response or "SystemMessages" in response:
                 print(f"❌ Got error response from Gemini, using fallback topics")
-                return [
-                    f"{company_name.title()} Digital Services",
-                    f"{company_name.title()} UX Design",
-                    f"{company_name.title()} Technology Solutions",
-                    f"{company_name.title()} Innovation Strategy",
-                    f"{company_name.title()} Business Consulting"
-                ]
-            
-            # Parse the response to extract topics
-            topics = []
-            lines = response.strip().split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if line and (line[0].isdigit() or line.startswith('-')):
-                    # Extract topic after number/bullet
-                    topic = re.sub(r'^[\d\-\.\)\s]+', '', line).strip()
-                    # Remove brackets if present
-                    topic = re.sub(r'^\[|\]$', '', topic).strip()
-                    if topic and not topic.startswith("Additional Topic") and not topic.startswith("Topic") and "Error:" not in topic:
-                        topics.append(topic)
+                return _fallback_topics(company_name)
+            
+            # Parse the response to extract topics from all numbered/bulleted lines at once,
+            # dropping entries that are empty once their brackets are removed (e.g. "2. [ ]")
+            candidates = (_BRACKETS.sub('', item).strip() for item in _LIST_ITEM.findall(response))
+            topics = [
+                topic for topic in candidates
+                if topic and not topic.startswith(("Additional Topic", "Topic")) and "Error:" not in topic
+            ][:5]
             
             # If we didn't get good topics, try alternative parsing
             if len(topics) < 3:
@@ -239,13 +355,7 @@ class TopicExtractor:
             
             # Final fallback - generate descriptive topics based on company name
             if len(topics) < 5:
-                fallback_topics = [
-                    f"{company_name.title()} Digital Services",
-                    f"{company_name.title()} UX Design",
-                    f"{company_name.title()} Technology Solutions",
-                    f"{company_name.title()} Innovation Strategy",
-                    f"{company_name.title()} Business Consulting"
-                ]
+                fallback_topics = _fallback_topics(company_name)
                 
                 while len(topics) < 5:
                     topics.append(fallback_topics[len(topics)])
@@ -262,21 +372,32 @@ class TopicExtractor:
         except Exception as e:
             print(f"❌ Error extracting topics from {company_name}: {str(e)}")
             # Better fallback based on company name
-            return [
-                f"{company_name.title()} Digital Services", 
-                f"{company_name.title()} UX Design",
-                f"{company_name.title()} Technology Solutions",
-                f"{company_name.title()} Innovation Strategy", 
-                f"{company_name.title()} Business Consulting"
-            ]
-    def generate_topics_from_milvus_data(self):
-        data = self.get_milvus_data()
-        all_company_topics = {}
-        for company_name, text in data.items():
-            print(f"\n🔍 Processing {company_name}...")
-            topics = self.extract_topics_from_text(text, company_name)
-            all_company_topics[company_name] = topics
-        return all_company_topics
+            return _fallback_topics(company_name)
+    
+    @staticmethod
+    def used_fallback(company_name: str, topics: List[str]) -> bool:
+        """
+        Check whether extract_topics_from_text had to fill in placeholder topics
+        (Gemini error or unparseable response) for this company.
+        
+        Args:
+            company_name: Company name passed to extract_topics_from_text
+            topics: Topics it returned
+            
+        Returns:
+            True if any topic is a placeholder
+        """
+        return not set(_fallback_topics(company_name)).isdisjoint(topics)
+    
+    def generate_topics_from_milvus_data(self, companies: List[str] = None):
+        data = self.get_milvus_data(companies if companies is not None else self.companies)
+        # Each company is one Gemini round-trip, so run them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            futures = {}
+            for company_name, text in data.items():
+                print(f"\n🔍 Processing {company_name}...")
+                futures[company_name] = executor.submit(self.extract_topics_from_text, text, company_name)
+        return {company_name: future.result() for company_name, future in futures.items()}
     
     def process_all_csv_files(self) -> Dict[str, List[str]]:
         """
@@ -289,24 +410,34 @@ class TopicExtractor:
         if not csv_files:
             return {}
         
-        all_company_topics = {}
+        # Each file is one Gemini round-trip, so run them concurrently
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            results = list(executor.map(self._process_csv_file, csv_files))
         
-        for csv_file in csv_files:
-            company_name = os.path.basename(csv_file).replace('.csv', '').replace('_scraped_data', '')
-            
-            print(f"\n🔍 Processing {company_name}...")
+        return {company_name: topics for company_name, topics in results if topics is not None}
+    
+    def _process_csv_file(self, csv_file: str):
+        """
+        Read one CSV file and extract its topics.
+        
+        Args:
+            csv_file: Path to the CSV file
             
-            # Read CSV content
-            text_content = self.read_csv_content(csv_file)
+        Returns:
+            Tuple of company name and topics (None if the file has no usable content)
+        """
+        company_name = os.path.basename(csv_file).replace('.csv', '').replace('_scraped_data', '')
+        
+        print(f"\n🔍 Processing {company_name}...")
+        
+        # Read CSV content
+        text_content = self.read_csv_content(csv_file)
 
-            if not text_content:
-                continue
-            
-            # Extract topics
-            topics = self.extract_topics_from_text(text_content, company_name)
-            all_company_topics[company_name] = topics
+        if not text_content:
+            return company_name, None
         
-        return all_company_topics
+        # Extract topics
+        return company_name, self.extract_topics_from_text(text_content, company_name)
     
     def save_all_topics(self, all_company_topics: Dict[str, List[str]]) -> str:
         """
@@ -321,27 +452,21 @@ class TopicExtractor:
         output_file = "all_competitor_topics.txt"
         
         try:
+            lines = ["COMPETITOR TOPICS ANALYSIS", "=" * 50, ""]
+            
+            for company, topics in all_company_topics.items():
+                lines.append(f"Company: {company}")
+                lines.append("-" * 30)
+                lines.extend(f"{i}. {topic}" for i, topic in enumerate(topics, 1))
+                lines.append("")
+            
+            # Create a flat list of all topics for easy reference
+            lines.extend(["", "ALL TOPICS (FLAT LIST)", "=" * 30])
+            lines.extend(f"{i}. {topic}" for i, topic in enumerate(chain.from_iterable(all_company_topics.values()), 1))
+            
+            # Built in memory and written in a single call
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("COMPETITOR TOPICS ANALYSIS\n")
-                f.write("=" * 50 + "\n\n")
-                
-                for company, topics in all_company_topics.items():
-                    f.write(f"Company: {company}\n")
-                    f.write("-" * 30 + "\n")
-                    for i, topic in enumerate(topics, 1):
-                        f.write(f"{i}. {topic}\n")
-                    f.write("\n")
-                
-                # Create a flat list of all topics for easy reference
-                f.write("\nALL TOPICS (FLAT LIST)\n")
-                f.write("=" * 30 + "\n")
-                
-                all_topics_flat = []
-                for topics in all_company_topics.values():
-                    all_topics_flat.extend(topics)
-                
-                for i, topic in enumerate(all_topics_flat, 1):
-                    f.write(f"{i}. {topic}\n")
+                f.write("\n".join(lines) + "\n")
             
             print(f"✅ Saved all topics to '{output_file}'")
             return output_file
@@ -421,16 +546,8 @@ class TopicExtractor:
         try:
             response = self.gemini.chat_with_system_prompt(user_message, system_prompt)
             
-            # Parse missing topics
-            missing_topics = []
-            lines = response.strip().split('\n')
-            
-            for line in lines:
-                line = line.strip()
-                if line and (line[0].isdigit() or line.startswith('-')):
-                    topic = re.sub(r'^[\d\-\.\)\s]+', '', line).strip()
-                    if topic:
-                        missing_topics.append(topic)
+            # Parse missing topics from every numbered/bulleted line in one pass
+            missing_topics = _LIST_ITEM.findall(response)
             
             print(f"✅ Found {len(missing_topics)} missing topics")
             return missing_topics
@@ -453,26 +570,25 @@ class TopicExtractor:
         output_file = "ergosign_missing_topics.txt"
         
         try:
+            lines = ["ERGOSIGN TOPIC GAP ANALYSIS", "=" * 50, ""]
+            
+            lines.append("ERGOSIGN'S CURRENT TOPICS:")
+            lines.append("-" * 30)
+            lines.extend(f"{i}. {topic}" for i, topic in enumerate(ergosign_topics, 1))
+            
+            lines.extend(["", "TOPICS MISSING FROM ERGOSIGN (COVERED BY COMPETITORS):", "-" * 60])
+            
+            if missing_topics:
+                lines.extend(f"{i}. {topic}" for i, topic in enumerate(missing_topics, 1))
+            else:
+                lines.append("No missing topics found - Ergosign covers all competitor topics!")
+            
+            lines.extend(["", f"TOTAL MISSING TOPICS: {len(missing_topics)}"])
+            lines.append(f"ANALYSIS DATE: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}")
+            
+            # Built in memory and written in a single call
             with open(output_file, 'w', encoding='utf-8') as f:
-                f.write("ERGOSIGN TOPIC GAP ANALYSIS\n")
-                f.write("=" * 50 + "\n\n")
-                
-                f.write("ERGOSIGN'S CURRENT TOPICS:\n")
-                f.write("-" * 30 + "\n")
-                for i, topic in enumerate(ergosign_topics, 1):
-                    f.write(f"{i}. {topic}\n")
-                
-                f.write(f"\nTOPICS MISSING FROM ERGOSIGN (COVERED BY COMPETITORS):\n")
-                f.write("-" * 60 + "\n")
-                
-                if missing_topics:
-                    for i, topic in enumerate(missing_topics, 1):
-                        f.write(f"{i}. {topic}\n")
-                else:
-                    f.write("No missing topics found - Ergosign covers all competitor topics!\n")
-                
-                f.write(f"\nTOTAL MISSING TOPICS: {len(missing_topics)}\n")
-                f.write(f"ANALYSIS DATE: {pd.Timestamp.now().strftime('%Y-%m-%d %H:%M:%S')}\n")
+                f.write("\n".join(lines) + "\n")
             
             print(f"✅ Saved missing topics analysis to '{output_file}'")
             return output_file
@@ -1,32 +1,67 @@
 import os
+import sys
+import atexit
 from dotenv import load_dotenv
-from huggingface_hub import InferenceClient
-from pymilvus import MilvusClient
+from pymilvus import MilvusClient, DataType
 from datetime import datetime
 
-def dump_to_milvus(blog_title, blog_content, URL, company_name):
-    load_dotenv()
+# The embedding model, int8 quantization and cache are shared with the ingestion code in
+# data_adapter (the only folder the scraper container ships), so they're defined once there
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data_adapter"))
+from embeddings import EMBEDDING_DIM, embed
+
+load_dotenv()
+
+# Created once per process and reused by every insert
+_milvus_client = MilvusClient(uri=os.environ.get("ZILLIZ_URI"), token=os.environ.get("ZILLIZ_TOKEN"))
+atexit.register(_milvus_client.close)
+
+def create_collection():
+    """Create the blogs collection. Timestamps are INT64 epoch microseconds so they can be range-filtered server-side;
+    embeddings are normalized int8 vectors (see embeddings.quantize), a quarter of the size of float32.
+    company_name is the partition key, so per-company queries only scan that company's partition."""
+    schema = _milvus_client.create_schema(auto_id=True)
+    schema.add_field("id", DataType.INT64, is_primary=True)
+    schema.add_field("title", DataType.VARCHAR, max_length=2048)
+    schema.add_field("title_embeddings", DataType.INT8_VECTOR, dim=EMBEDDING_DIM)
+    schema.add_field("body", DataType.VARCHAR, max_length=65535)
+    schema.add_field("URL", DataType.VARCHAR, max_length=2048)
+    schema.add_field("body_embeddings", DataType.INT8_VECTOR, dim=EMBEDDING_DIM)
+    schema.add_field("timestamp", DataType.INT64)
+    schema.add_field("company_name", DataType.VARCHAR, max_length=256, is_partition_key=True)
+
+    index_params = _milvus_client.prepare_index_params()
+    index_params.add_index("title_embeddings", index_type="HNSW", metric_type="COSINE")
+    index_params.add_index("body_embeddings", index_type="HNSW", metric_type="COSINE")
+    index_params.add_index("timestamp", index_type="STL_SORT")
+
+    _milvus_client.create_collection(os.environ.get("COLLECTION_NAME"), schema=schema, index_params=index_params)
+
+def dump_to_milvus(rows: list[dict]):
+    """Embed and insert blogs given as dicts with "title", "body", "URL" and "company_name" keys."""
+    if not rows:
+        return
 
     # ============== QWEN EMBEDDINGS ==============
 
-    hf_client = InferenceClient(
-            provider="auto",
-            api_key=os.environ.get("HF_TOKEN"),
-        )
-    blog_title_embeddings   = hf_client.feature_extraction(blog_title,model="Qwen/Qwen3-Embedding-8B",).tolist()[0]
-    blog_content_embeddings = hf_client.feature_extraction(blog_content,model="Qwen/Qwen3-Embedding-8B",).tolist()[0]
+    # One request for every title and body in the batch that isn't cached yet
+    texts      = [row["title"] for row in rows] + [row["body"] for row in rows]
+    embeddings = embed(texts)
+    blog_title_embeddings, blog_content_embeddings = embeddings[:len(rows)], embeddings[len(rows):]
 
     # ============== ZILLIZ PIPELINE ==============
 
-    milvus_client = MilvusClient(uri=os.environ.get("ZILLIZ_URI"), token=os.environ.get("ZILLIZ_TOKEN"))
+    timestamp = int(datetime.now().timestamp() * 1_000_000)
+    records = [{"title":row["title"],
+                "title_embeddings":title_embeddings, 
+                "body":row["body"],
+                "URL":row["URL"],
+                "body_embeddings":content_embeddings,
+                "timestamp":timestamp,
+                "company_name":row["company_name"]
+                }
+               for row, title_embeddings, content_embeddings in zip(rows, blog_title_embeddings, blog_content_embeddings)]
 
-    milvus_client.insert(os.environ.get("COLLECTION_NAME"), [{"title":blog_title,
-                                            "title_embeddings":blog_title_embeddings, 
-                                            "body":blog_content,
-                                            "URL":URL,
-                                            "body_embeddings":blog_content_embeddings,
-                                            "timestamp":str(datetime.now()),
-                                            "company_name":company_name
-                                            }])
+    _milvus_client.insert(os.environ.get("COLLECTION_NAME"), records)
 
-    # print(f"Dumped blog data for \033[1m{blog_title}\033[0m into Milvus successfully! ✅")
\ No newline at end of file
+    # print(f"Dumped {len(records)} blogs into Milvus successfully! ✅")
\ No newline at end of file
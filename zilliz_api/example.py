@@ -3,5 +3,6 @@ blog_title = "Creating a new legacy of payments growth"
 blog_content = """
 [ Download report ](https://www.accenture.com/content/dam/accenture/final/accenture-com/document-3/Accenture-A-New-Legacy-Of-Payments-Growth-Report.pdf#zoom=40 "Opens the PDF full report, A new legacy of payments growth, in a new tab.") RESEARCH REPORT # Creating a new legacy of payments growth How banks can reinvent payments with a strong digital core 5-MINUTE READ December 18, 2024 ## In brief * Embracing a payments reinvention strategy can help banks gain market share amid the relentless rise of alternative payment providers. * We surveyed 326 bank executives to uncover opportunities and strategies shaping payments modernization in today‚Äôs complex market landscape. * Banks can tap into a $55 billion opportunity by building a strong digital core that enables innovative solutions and operational efficiency gains. [ Read the report ](https://www.accenture.com/content/dam/accenture/final/accenture-com/document-3/Accenture-A-New-Legacy-Of-Payments-Growth-Report.pdf#zoom=40 "Opens the PDF full report, A new legacy of payments growth, in a new tab.") [ View the infographic ](https://www.accenture.com/content/dam/accenture/final/industry/banking/document/Accenture-Payments-Technology-Reinvention-Global-Infographic.pdf#zoom=50 "Opens the PDF infographic, A new legacy of payments growth, in a new tab.") ## Accelerated pace of change demands more from payments The world of payments faces a constant whirlwind of developments from biometric authentication to scan-to-pay QR codes and real-time payments. It's not surprising that the biggest challenge impacting banks' payments plans and investment decisions is dealing with the fast pace of technology innovation. These technology disruptions are directly related to the changing needs of banks‚Äô payments customers. Both consumers and commercial clients are increasingly demanding more from their payment experiences. Consumers are abandoning checks and cash in favor of digital payments at a rapid rate and commercial clients want banks to provide more value-added services to address their unmet payment needs. 1/3 of commercial clients cite lack of value-added services as biggest pain point from their payment provider 85% of consumers use digital wallet for everyday transactions, up from 56% in 2022 Unlike their more agile digital challengers, many banks aren‚Äôt adapting fast enough to deliver next-generation payment solutions. Last year‚Äôs research revealed that 2 out of 5 commercial payments clients already prefer fintechs and bigtechs over their banks for innovative value-added payments services. Our _[Payments Technology Reinvention Study](https://www.accenture.com/content/dam/accenture/final/accenture-com/document-3/Accenture-A-New-Legacy-Of-Payments-Growth-Report.pdf#zoom=40 " Opens the PDF full report, A new legacy of payments growth, in a new tab.")_ found that 59% of banks still struggle with legacy payments IT systems and infrastructure, limiting their ability to meet customer demands quickly and affordably. To protect their ground, banks need a bold, forward-looking payment strategy, or they risk losing market share as customers opt for alternative providers for their payment needs. The good news is that there is a path forward for banks bogged down by legacy technology and operational inefficiency. Our analysis of 326 banks across 18 markets identified a group of leading banks that operate at a level that accelerates new payment offerings and preparations for new regulatory standards. What sets them apart is their adoption of a reinvention strategy. The key to that strategy is a modern digital core that helps drive growth, optimize operations, bolster resilience and fuel competitive advantage. > Our research shows that banks could unlock $55 billion in efficiencies and new revenue streams if they embrace a strategy of reinvention and build a strong digital core for payments. ## Navigate a path to payments reinvention To help banks create a new legacy of payments growth, we analyzed how leading banks shape their payments modernization strategy and technology investments, seeking the best paths forward. Our findings suggest that four key actions can open up a world of potential growth and profit. 01 ## Move from one-off investments to continuous modernization How are leading banks approaching their strategy to payments reinvention? They thoughtfully plan for the future and take a longer-term, more continuous approach, with investments being made incrementally to support both regulatory and customer demands. 51% of leading banks opt for an incremental approach to investments rather than large one-off investments 1/3 say new products for customers is the primary focus that drives their technology investments 1.5x more likely to exploit their regulatory investments to develop new offerings compared to other banks 02 ## Invest in strengthening the digital core for payments Leading banks benefit from a mature digital core, which allows them to deploy new payment features in response to market demand and make swift adjustments based on product feedback and regulatory requirements. #### What is a digital core for payments? A digital core is the critical technological capability that can create and empower an organization's unique reinvention ambitions. From a payments perspective, all three components of the digital core contribute uniquely‚Äîand powerfully‚Äîto payment innovation and execution. * **Digital platforms:** Payments applications and platforms that facilitate the flow of funds between parties, including domestic current account payments, international payments, merchant services, card payments and more. * **Data and AI backbone:** Powers efficient, personalized payments products and services, enabling cross-sell and upsell opportunities across client and ecosystem environments. * **Digital foundation:** A strong digital foundation is essential for securely running a bank‚Äôs payments function and ensuring seamless integration across a multi-vendor ecosystem. Beyond composable integration and a cloud-first infrastructure, it includes a Payments Control Tower that provides real-time visibility into the performance of the payments application stack. #### How leading banks strengthen their digital core What sets leading banks apart is their focus on building all parts of a digital core equally. Other banks in our sample prioritize only a few areas, such as cloud and AI. Especially worrying is their lack of modernization in the integration layer, which limits their ability to adopt new technology and respond quickly to business needs. Leading banks‚Äô strengths stand out on application integration. For example, when it comes to their intelligent integration practices, 85% use AI, automation and dynamic orchestration for their payment applications, while only 18% of other banks do the same. [Read our report](https://www.accenture.com/content/dam/accenture/final/accenture-com/document-3/Accenture-A-New-Legacy-Of-Payments-Growth-Report.pdf#zoom=40 "Opens the PDF full report, A new legacy of payments growth, in a new tab.") for a deeper view of how leading banks have a significant lead over other banks across the digital core components. 03 ## Tackle technical debt in payments Accenture‚Äôs [report](https://www.accenture.com/us-en/insights/consulting/build-tech-balance-debt) reveals that a degree of tech debt is healthy for the balance sheet. But throwing too much money at tech debt can be counterproductive. The research found allocating 15% of the IT budget toward tech debt remediation ensures the greatest return for the investments. This balances debt reduction while also prioritizing future strategic innovations. Banks need to think about prioritizing investments in payments areas burdened by tech debt to ensure alignment with future growth strategies. Our payments research found that the application integration layer has the highest levels of tech debt, affecting more than half of the banks in our study. Core payments platforms follow closely, with 44% of our respondents identifying them as an area of concern. 51% of banks say the application integration layer carries the most technical debt in the payments tech stack Banks should also consider focusing their investments on payments areas that have high levels of tech debt and are expected to show above-average growth. Globally, these include consumer and commercial domestic payments, followed by cross-border payments. But even areas with lower tech debt, like cash management and trade finance, are ripe for modernization due to their high levels of manual processes. 04 ## Leverage generative AI to accelerate payments reinvention Generative AI can help modernize payments businesses in many ways, and automation is the first that comes to mind. More than half (60%) of banks struggle with essential technology skills. Generative AI can bridge this gap by optimizing workforce capacity and resources‚Äîautomating repetitive manual tasks and enhancing human efforts through augmentation. Leading banks have already automated 40% of manual tasks and augmented 39% of human tasks in payments. But the strategic use of generative AI can go beyond automating routine tasks‚Äîit can enable hyper-personalization in payment experiences, uncover new revenue streams and enhance fraud detection capabilities. Leading banks are selective in how and where they align their generative AI investments, with consumer and commercial domestic payments being the top priority, followed by international commercial payments. ## Why it pays to reinvent Several leading banks are already reaping the benefits of their reinvention efforts and digital core investments. Based on our analysis, these banks show a 2% increase in their ‚Äòpayments operating jaws‚Äô‚Äîthe difference between payments revenue growth and operational costs growth‚Äîbetween 2023 and 2025, enabling them to capture benefits worth $14 billion. The time is ripe to take advantage of the opportunity in payments. _[Read our report](https://www.accenture.com/content/dam/accenture/final/accenture-com/document-3/Accenture-A-New-Legacy-Of-Payments-Growth-Report.pdf#zoom=40 "Opens the PDF full report, A new legacy of payments growth, in a new tab.")_ to learn how banks can reinvent payments to create a new legacy of growth. [ Read the report ](https://www.accenture.com/content/dam/accenture/final/accenture-com/document-3/Accenture-A-New-Legacy-Of-Payments-Growth-Report.pdf#zoom=40 "Opens the PDF full report, A new legacy of payments growth, in a new tab.") [ View the infographic ](https://www.accenture.com/content/dam/accenture/final/industry/banking/document/Accenture-Payments-Technology-Reinvention-Global-Infographic.pdf#zoom=50 "Opens the PDF infographic, A new legacy of payments growth, in a new tab.") ## Related insights * [ Banking Consumer Study 2025](https://www.accenture.com/us-en/insights/banking/consumer-study-banking-advocacy-powering-growth) * [ Reinventing with the Digital Core in Banking](https://www.accenture.com/us-en/insights/banking/reinventing-digital-core-banking) * [ Top 10 banking trends in 2025 and beyond](https://www.accenture.com/us-en/insights/banking/top-10-trends-banking-2025) * [ Reinventing with a digital core](https://www.accenture.com/us-en/insights/technology/reinventing-digital-core) * [ Building a reinvention-ready digital core](https://www.accenture.com/us-en/insights/technology/building-reinvention-ready-digital-core) * [ Build your tech and balance your debt](https://www.accenture.com/us-en/insights/consulting/build-tech-balance-debt) ### WRITTEN BY Sulabh Agarwal Managing Director ‚Äì Global Payments Lead Ryan McQueen Managing Director ‚Äì Payments Lead, Asia Markets Brian Shniderman Senior Managing Director ‚Äì Payments Lead, North America Kim Kacal Managing Director ‚Äì North America Edlayne Burr Managing Director ‚Äì Payments Lead, Latin America Hannes Fourie Manager ‚Äì Accenture Research, Payments Lead
 """
+URL = "https://www.accenture.com/"
 company_name = "Accenture"
-dump_to_milvus(blog_title, blog_content, company_name)
\ No newline at end of file
+dump_to_milvus([{"title": blog_title, "body": blog_content, "URL": URL, "company_name": company_name}])
\ No newline at end of file